@@ -60,8 +60,12 @@ class event_variant
 
 namespace internal {
 
+// Use a fold over std::is_same_v rather than std::disjunction of
+// std::is_same, so that (with standard libraries that implement is_same_v
+// via the compiler builtin) no class template is instantiated per event type.
 template <typename Event, typename... Events>
-struct event_is_one_of : std::disjunction<std::is_same<Event, Events>...> {};
+struct event_is_one_of
+    : std::bool_constant<(std::is_same_v<Event, Events> || ...)> {};
 
 } // namespace internal
 